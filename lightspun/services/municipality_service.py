@@ -5,20 +5,73 @@ This module handles all municipality-related business logic and db.database oper
 Provides CRUD operations and specialized queries for municipalities.
 """
 
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from .. import database as db
-from ..schemas import Municipality, MunicipalityCreate, MunicipalityUpdate
+from ..schemas import Municipality, MunicipalityCreate, MunicipalityUpdate, State
 from ..logging_config import get_logger
 from ..utils.database_operations import DatabaseOperations
+from .state_service import StateService
 
 # Initialize logger
 municipality_logger = get_logger('lightspun.services.municipality')
 
+# States are reference data that rarely change, so the lookups done to
+# validate new municipalities are kept in a small LRU. It is cleared whenever a
+# state is updated or deleted through StateService.
+#
+# The cache is per process: a change made in one server worker only clears
+# that worker's copy. Entries therefore expire after STATE_CACHE_TTL seconds,
+# which bounds how long another worker can keep accepting municipalities for
+# a state that was just deleted.
+STATE_CACHE_SIZE = 128
+STATE_CACHE_TTL = 60.0
+_state_cache: "OrderedDict[int, Tuple[State, float]]" = OrderedDict()
+
+StateService.add_state_change_listener(_state_cache.clear)
+
+
+async def _get_state_cached(state_id: int) -> Optional[State]:
+    """Get a state by ID, reusing states fetched within the last STATE_CACHE_TTL seconds"""
+    entry = _state_cache.get(state_id)
+    if entry is not None:
+        state, expires_at = entry
+        if time.monotonic() < expires_at:
+            _state_cache.move_to_end(state_id)
+            return state
+        del _state_cache[state_id]
+    
+    state = await StateService.get_state_by_id(state_id)
+    if state:
+        _state_cache[state_id] = (state, time.monotonic() + STATE_CACHE_TTL)
+        if len(_state_cache) > STATE_CACHE_SIZE:
+            _state_cache.popitem(last=False)
+    return state
+
+
+# Static fragments of the advanced search query. Only the WHERE clause
+# varies between calls, so the rest is built once at import time.
+_ADVANCED_SEARCH_BASE = """
+            SELECT m.id, m.name, m.type, m.state_id
+            FROM municipalities m
+            JOIN states s ON m.state_id = s.id
+        """
+_ADVANCED_SEARCH_ORDER = " ORDER BY m.name LIMIT :limit"
+_WHERE_NAME = "(m.name ILIKE :name_pattern)"
+_WHERE_TYPE = "m.type = :municipality_type"
+_WHERE_STATE_CODE = "s.code = :state_code"
+
 
 class MunicipalityService:
     """Service class for municipality operations"""
 
+    @staticmethod
+    def clear_state_cache() -> None:
+        """Drop the cached states used to validate new municipalities"""
+        _state_cache.clear()
+
     @staticmethod
     async def get_municipalities_by_state_code(state_code: str) -> List[Municipality]:
         """Get municipalities by state code (optimized with state_id index)"""
@@ -115,8 +168,7 @@ class MunicipalityService:
         municipality_logger.info(f"Creating new municipality: {municipality_data.name}")
         
         # Validate state exists
-        from .state_service import StateService
-        state = await StateService.get_state_by_id(municipality_data.state_id)
+        state = await _get_state_cached(municipality_data.state_id)
         if not state:
             raise ValueError(f"State with ID {municipality_data.state_id} does not exist")
         
@@ -202,6 +254,10 @@ class MunicipalityService:
         """Get statistics about municipalities"""
         municipality_logger.debug("Fetching municipality statistics")
         
+        # These run one after another on purpose: databases serves every query
+        # through one shared connection guarded by a query lock, so gathering
+        # them would not overlap anything
+        
         # Get total count
         total_count = await DatabaseOperations.count("municipalities")
         
@@ -250,37 +306,30 @@ class MunicipalityService:
         """Advanced search for municipalities with multiple filters"""
         municipality_logger.debug(f"Advanced municipality search: name='{name_query}', type='{municipality_type}', state='{state_code}'")
         
-        # Build dynamic query
+        # Build dynamic query from the precomputed fragments
         where_conditions = []
         parameters = {}
         
         if name_query:
-            where_conditions.append("(m.name ILIKE :name_pattern)")
+            where_conditions.append(_WHERE_NAME)
             parameters["name_pattern"] = f"%{name_query}%"
         
         if municipality_type:
-            where_conditions.append("m.type = :municipality_type")
+            where_conditions.append(_WHERE_TYPE)
             parameters["municipality_type"] = municipality_type
         
         if state_code:
-            where_conditions.append("s.code = :state_code")
+            where_conditions.append(_WHERE_STATE_CODE)
             parameters["state_code"] = state_code.upper()
         
         parameters["limit"] = limit
         
-        # Build the complete query
-        base_query = """
-            SELECT m.id, m.name, m.type, m.state_id
-            FROM municipalities m
-            JOIN states s ON m.state_id = s.id
-        """
-        
         if where_conditions:
-            base_query += f" WHERE {' AND '.join(where_conditions)}"
-        
-        base_query += " ORDER BY m.name LIMIT :limit"
+            query = f"{_ADVANCED_SEARCH_BASE} WHERE {' AND '.join(where_conditions)}{_ADVANCED_SEARCH_ORDER}"
+        else:
+            query = _ADVANCED_SEARCH_BASE + _ADVANCED_SEARCH_ORDER
         
-        rows = await db.database.fetch_all(query=base_query, values=parameters)
+        rows = await db.database.fetch_all(query=query, values=parameters)
         
         results = [Municipality.model_validate(dict(row)) for row in rows]
         municipality_logger.debug(f"Advanced search found {len(results)} municipalities")
@@ -5,7 +5,7 @@ This module handles all state-related business logic and db.database operations.
 Provides CRUD operations and specialized queries for states.
 """
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from .. import database as db
 from ..schemas import State, StateCreate, StateUpdate
@@ -15,10 +15,25 @@ from ..utils.database_operations import DatabaseOperations
 # Initialize logger
 state_logger = get_logger('lightspun.services.state')
 
+# Callbacks run after a state is updated or deleted, so other services can drop
+# any state rows they keep around without StateService knowing about them
+_state_change_listeners: List[Callable[[], None]] = []
+
 
 class StateService:
     """Service class for state operations"""
 
+    @staticmethod
+    def add_state_change_listener(listener: Callable[[], None]) -> None:
+        """Register a callback to run whenever a state is updated or deleted"""
+        _state_change_listeners.append(listener)
+
+    @staticmethod
+    def _notify_state_change() -> None:
+        """Run the registered state change callbacks"""
+        for listener in _state_change_listeners:
+            listener()
+
     @staticmethod
     async def get_all_states() -> List[State]:
         """Get all states"""
@@ -99,6 +114,7 @@ class StateService:
         
         if result:
             state_logger.info(f"Updated state: {result['name']} ({result['code']})")
+            StateService._notify_state_change()
             return State.model_validate(result)
         else:
             state_logger.warning(f"State {state_id} not found for update")
@@ -129,6 +145,7 @@ class StateService:
         
         if success:
             state_logger.info(f"Deleted state: {state.name} ({state.code})")
+            StateService._notify_state_change()
         else:
             state_logger.error(f"Failed to delete state {state_id}")
         
@@ -18,6 +18,8 @@ Standard formats chosen based on USPS publication 28 and common usage:
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, Set
 
 # Standard street type formats (target formats)
@@ -122,6 +124,15 @@ STREET_TYPE_MAPPING: Dict[str, str] = {
     'Crk': 'Creek',
 }
 
+# Lowercased variant -> standard form, so a suffix is resolved with a single
+# dict lookup instead of a scan over every variant. Keys and values are
+# interned so every lookup table and result shares one string object each.
+_STREET_TYPE_LOOKUP: Dict[str, str] = {
+    sys.intern(variant.lower()): sys.intern(standard_type)
+    for variant, standard_type in STREET_TYPE_MAPPING.items()
+}
+
+@lru_cache(maxsize=4096)
 def standardize_street_type(street_name: str) -> str:
     """
     Standardize street types in a street name.
@@ -146,20 +157,11 @@ def standardize_street_type(street_name: str) -> str:
     if not parts:
         return street_name
     
-    # The street type is typically the last word
-    last_part = parts[-1]
-    
-    # Check if the last part is a street type that needs standardization
-    # Use case-insensitive lookup
-    street_type_key = last_part
-    for key in STREET_TYPE_MAPPING.keys():
-        if last_part.lower() == key.lower():
-            street_type_key = key
-            break
-    
-    if street_type_key in STREET_TYPE_MAPPING:
+    # The street type is typically the last word; look it up case-insensitively
+    standard_type = _STREET_TYPE_LOOKUP.get(parts[-1].lower())
+    if standard_type is not None:
         # Replace the last part with the standardized version
-        parts[-1] = STREET_TYPE_MAPPING[street_type_key]
+        parts[-1] = standard_type
         return ' '.join(parts)
     
     return street_name
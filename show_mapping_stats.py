@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Script to show statistics about the street type mapping.
+
+Lists every standard street type with the variants that map to it.
+"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add the lightspun package to the path
+sys.path.append(str(Path(__file__).parent))
+
+from lightspun.utils.street_standardization import STREET_TYPE_MAPPING
+
+def show_mapping_stats():
+    """Show statistics about the street type mapping"""
+    
+    print("📊 Street Type Mapping Statistics")
+    print("=" * 60)
+    
+    # Group variants by target type in a single pass over the mapping
+    variants_by_target = defaultdict(list)
+    for variant, target in STREET_TYPE_MAPPING.items():
+        variants_by_target[target].append(variant)
+    
+    print(f"Standard target types: {len(variants_by_target)}")
+    print(f"Total mapping variants: {len(STREET_TYPE_MAPPING)}")
+    
+    print("\nMappings by target type:")
+    for target in sorted(variants_by_target):
+        variants = variants_by_target[target]
+        print(f"  {target}: {len(variants)} variants")
+        print(f"    {', '.join(sorted(variants))}")
+    
+    print()
+
+
+if __name__ == "__main__":
+    show_mapping_stats()
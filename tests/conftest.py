@@ -11,14 +11,16 @@ import asyncpg
 from lightspun.app import app
 from lightspun.config import get_config
 from lightspun.database import database
+from utils import DatabaseTestHelper
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows); fall back to asyncio's loop
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @pytest.fixture(scope="session")
@@ -190,7 +192,7 @@ async def sample_addresses(db_connection, sample_states):
     return inserted_addresses
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_state_data():
     """Mock state data for unit tests."""
     return [
@@ -200,7 +202,13 @@ def mock_state_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_state_rows(mock_state_data):
+    """Mock database rows for the states, built once per session."""
+    return DatabaseTestHelper.create_mock_rows(mock_state_data)
+
+
+@pytest.fixture(scope="session")
 def mock_municipality_data():
     """Mock municipality data for unit tests.""" 
     return [
@@ -210,9 +218,21 @@ def mock_municipality_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_municipality_rows(mock_municipality_data):
+    """Mock database rows (plain mappings, like databases Records) built once per session."""
+    return [dict(municipality) for municipality in mock_municipality_data]
+
+
+@pytest.fixture(scope="session")
+def mock_city_rows(mock_municipality_data):
+    """Mock database rows for the city-type municipalities only."""
+    return [dict(m) for m in mock_municipality_data if m["type"] == "city"]
+
+
+@pytest.fixture(scope="session")
 def mock_address_data():
-    """Mock address data for unit tests."""
+    """Mock address data for unit tests (shared read-only across the session)."""
     return [
         {
             "id": 1,
@@ -234,4 +254,10 @@ def mock_address_data():
             "state_code": "CA",
             "full_address": "456 Oak Avenue Apt 2B, San Francisco, CA"
         }
-    ]
\ No newline at end of file
+    ]
+
+
+@pytest.fixture(scope="session")
+def mock_address_rows(mock_address_data):
+    """Mock database rows for the addresses, built once per session."""
+    return DatabaseTestHelper.create_mock_rows(mock_address_data)
\ No newline at end of file
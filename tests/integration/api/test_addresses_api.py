@@ -12,7 +12,6 @@ from fastapi.testclient import TestClient
 class TestAddressesAPI:
     """Integration test suite for Addresses API endpoints."""
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_success(self, test_client, sample_addresses):
         """Test GET /addresses/autocomplete with valid query."""
         response = test_client.get("/addresses/autocomplete?query=main")
@@ -36,7 +35,6 @@ class TestAddressesAPI:
             assert "street_address" in address
             assert "municipality_id" in address
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_case_insensitive(self, test_client, sample_addresses):
         """Test autocomplete is case insensitive."""
         # Test uppercase
@@ -64,7 +62,6 @@ class TestAddressesAPI:
         assert response.status_code == 422
         assert "at least 2 characters" in response.json()["detail"][0]["msg"]
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_no_results(self, test_client, sample_addresses):
         """Test autocomplete with query that returns no results."""
         response = test_client.get("/addresses/autocomplete?query=nonexistent")
@@ -75,7 +72,6 @@ class TestAddressesAPI:
         assert data["total_count"] == 0
         assert data["query"] == "nonexistent"
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_limit_parameter(self, test_client, sample_addresses):
         """Test autocomplete with limit parameter."""
         response = test_client.get("/addresses/autocomplete?query=street&limit=2")
@@ -84,7 +80,6 @@ class TestAddressesAPI:
         data = response.json()
         assert len(data["addresses"]) <= 2
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_with_municipality_filter(self, test_client, sample_addresses, sample_municipalities):
         """Test autocomplete with municipality filter."""
         # Get LA municipality ID
@@ -107,7 +102,6 @@ class TestAddressesAPI:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    @pytest.mark.asyncio
     async def test_get_address_by_id_success(self, test_client, sample_addresses):
         """Test GET /addresses/{address_id} with valid ID."""
         # Get an address ID
@@ -135,7 +129,6 @@ class TestAddressesAPI:
         response = test_client.get("/addresses/invalid")
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_address_success(self, test_client, sample_municipalities):
         """Test POST /addresses with valid data."""
         la_municipality = next(m for m in sample_municipalities if m["name"] == "Los Angeles")
@@ -185,7 +178,6 @@ class TestAddressesAPI:
         })
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_get_addresses_by_municipality_success(self, test_client, sample_addresses, sample_municipalities):
         """Test GET /municipalities/{municipality_id}/addresses."""
         la_municipality = next(m for m in sample_municipalities if m["name"] == "Los Angeles")
@@ -212,7 +204,6 @@ class TestAddressesAPI:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    @pytest.mark.asyncio
     async def test_addresses_api_data_integrity(self, test_client, sample_addresses, sample_municipalities):
         """Test data integrity constraints in addresses API."""
         # Verify addresses have valid municipality_id
@@ -223,7 +214,6 @@ class TestAddressesAPI:
             municipality_exists = any(m["id"] == municipality_id for m in sample_municipalities)
             assert municipality_exists, f"Address {address['id']} references non-existent municipality {municipality_id}"
 
-    @pytest.mark.asyncio
     async def test_addresses_autocomplete_ordering(self, test_client, sample_addresses):
         """Test that autocomplete results are properly ordered."""
         response = test_client.get("/addresses/autocomplete?query=street")
@@ -235,7 +225,6 @@ class TestAddressesAPI:
             # Should be consistent ordering
             assert len(address_strings) == len(set(address_strings))  # No duplicates
 
-    @pytest.mark.asyncio
     async def test_addresses_api_performance(self, test_client, sample_addresses):
         """Test basic performance of addresses API."""
         import time
@@ -252,7 +241,6 @@ class TestAddressesAPI:
         response = test_client.get("/addresses/autocomplete?query=test")
         assert response.headers["content-type"] == "application/json"
 
-    @pytest.mark.asyncio
     async def test_addresses_response_structure(self, test_client, sample_addresses):
         """Test addresses API response structure consistency."""
         response = test_client.get("/addresses/autocomplete?query=street")
@@ -272,7 +260,6 @@ class TestAddressesAPI:
             for field in address_fields:
                 assert field in address
 
-    @pytest.mark.asyncio
     async def test_addresses_api_pagination(self, test_client, sample_addresses):
         """Test addresses API pagination functionality."""
         # Test with limit
@@ -287,7 +274,6 @@ class TestAddressesAPI:
         data = response.json()
         assert len(data["addresses"]) <= 20  # Default limit
 
-    @pytest.mark.asyncio
     async def test_addresses_api_error_consistency(self, test_client):
         """Test error response consistency in addresses API."""
         # Test 404 errors
@@ -306,7 +292,6 @@ class TestAddressesAPI:
         response = test_client.get("/addresses/autocomplete?query=")
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_addresses_autocomplete_special_characters(self, test_client, sample_addresses):
         """Test autocomplete handles special characters properly."""
         # Test with special characters
@@ -317,7 +302,6 @@ class TestAddressesAPI:
         response = test_client.get("/addresses/autocomplete?query=123")
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_addresses_autocomplete_long_query(self, test_client):
         """Test autocomplete with very long query."""
         long_query = "a" * 500  # 500 character query
@@ -326,7 +310,6 @@ class TestAddressesAPI:
         # Should handle gracefully, either 200 with no results or 422 if length validation
         assert response.status_code in [200, 422]
 
-    @pytest.mark.asyncio
     async def test_addresses_create_duplicate_handling(self, test_client, sample_municipalities):
         """Test handling of potential duplicate addresses."""
         la_municipality = next(m for m in sample_municipalities if m["name"] == "Los Angeles")
@@ -345,7 +328,6 @@ class TestAddressesAPI:
         # Should either succeed (allowing duplicates) or fail with appropriate error
         assert response2.status_code in [201, 400, 409]
 
-    @pytest.mark.asyncio 
     async def test_addresses_multiple_municipalities(self, test_client, sample_addresses, sample_municipalities):
         """Test addresses API works across multiple municipalities."""
         municipality_ids = [m["id"] for m in sample_municipalities]
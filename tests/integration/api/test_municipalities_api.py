@@ -12,7 +12,6 @@ from fastapi.testclient import TestClient
 class TestMunicipalitiesAPI:
     """Integration test suite for Municipalities API endpoints."""
 
-    @pytest.mark.asyncio
     async def test_get_municipalities_in_state_success(self, test_client, sample_states, sample_municipalities):
         """Test GET /states/{state_code}/municipalities with valid state."""
         response = test_client.get("/states/CA/municipalities")
@@ -41,7 +40,6 @@ class TestMunicipalitiesAPI:
         # Verify count
         assert data["total_count"] == len(municipalities)
 
-    @pytest.mark.asyncio
     async def test_get_municipalities_in_state_lowercase(self, test_client, sample_states, sample_municipalities):
         """Test GET /states/{state_code}/municipalities with lowercase state code."""
         response = test_client.get("/states/ca/municipalities")
@@ -65,7 +63,6 @@ class TestMunicipalitiesAPI:
         response = test_client.get("/states/CAL/municipalities")
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_get_municipalities_in_state_empty(self, test_client, clean_db):
         """Test GET /states/{state_code}/municipalities with state that has no municipalities."""
         # Create a state with no municipalities
@@ -80,7 +77,6 @@ class TestMunicipalitiesAPI:
         assert data["total_count"] == 0
         assert data["state"]["code"] == "MT"
 
-    @pytest.mark.asyncio
     async def test_get_municipality_by_id_success(self, test_client, sample_states, sample_municipalities):
         """Test GET /municipalities/{municipality_id} with valid ID."""
         # Get a municipality ID
@@ -108,7 +104,6 @@ class TestMunicipalitiesAPI:
         response = test_client.get("/municipalities/invalid")
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_municipality_success(self, test_client, sample_states):
         """Test POST /municipalities with valid data."""
         ca_state = next(state for state in sample_states if state["code"] == "CA")
@@ -163,7 +158,6 @@ class TestMunicipalitiesAPI:
         })
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_municipalities_api_data_integrity(self, test_client, sample_states, sample_municipalities):
         """Test data integrity constraints in municipalities API."""
         # Verify municipalities have valid state_id
@@ -175,7 +169,6 @@ class TestMunicipalitiesAPI:
         for municipality in municipalities:
             assert municipality["state_id"] == ca_state["id"]
 
-    @pytest.mark.asyncio 
     async def test_municipalities_api_ordering(self, test_client, sample_states, sample_municipalities):
         """Test that municipalities are returned in correct order."""
         response = test_client.get("/states/CA/municipalities")
@@ -185,7 +178,6 @@ class TestMunicipalitiesAPI:
         municipality_names = [m["name"] for m in municipalities]
         assert municipality_names == sorted(municipality_names)
 
-    @pytest.mark.asyncio
     async def test_municipalities_api_multiple_states(self, test_client, sample_states, sample_municipalities):
         """Test municipalities API with multiple states."""
         # Test California municipalities
@@ -208,7 +200,6 @@ class TestMunicipalitiesAPI:
         assert ny_count == 2  # New York, Buffalo  
         assert tx_count == 2  # Houston, Dallas
 
-    @pytest.mark.asyncio
     async def test_municipalities_api_state_validation(self, test_client, sample_states, sample_municipalities):
         """Test that municipalities API validates state exists."""
         # Valid state
@@ -224,7 +215,6 @@ class TestMunicipalitiesAPI:
         response = test_client.get("/states/CA/municipalities")
         assert response.headers["content-type"] == "application/json"
 
-    @pytest.mark.asyncio
     async def test_municipalities_api_performance(self, test_client, sample_states, sample_municipalities):
         """Test basic performance of municipalities API."""
         import time
@@ -236,7 +226,6 @@ class TestMunicipalitiesAPI:
         assert response.status_code == 200
         assert duration < 1.0  # Should respond in under 1 second
 
-    @pytest.mark.asyncio
     async def test_municipalities_response_structure(self, test_client, sample_states, sample_municipalities):
         """Test municipalities API response structure consistency."""
         response = test_client.get("/states/CA/municipalities")
@@ -262,7 +251,6 @@ class TestMunicipalitiesAPI:
         for field in state_fields:
             assert field in state
 
-    @pytest.mark.asyncio
     async def test_municipalities_api_error_consistency(self, test_client):
         """Test error response consistency in municipalities API."""
         # Test 404 errors
@@ -21,7 +21,6 @@ class TestStatesAPI:
         assert data["states"] == []
         assert data["total_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_all_states_with_data(self, test_client, sample_states):
         """Test GET /states with states in database."""
         response = test_client.get("/states")
@@ -41,7 +40,6 @@ class TestStatesAPI:
         state_names = [state["name"] for state in data["states"]]
         assert state_names == sorted(state_names)
 
-    @pytest.mark.asyncio
     async def test_get_state_by_code_success(self, test_client, sample_states):
         """Test GET /states/{state_code} with valid state code."""
         response = test_client.get("/states/CA")
@@ -52,7 +50,6 @@ class TestStatesAPI:
         assert data["name"] == "California"
         assert "id" in data
 
-    @pytest.mark.asyncio
     async def test_get_state_by_code_lowercase(self, test_client, sample_states):
         """Test GET /states/{state_code} with lowercase state code."""
         response = test_client.get("/states/ca")
@@ -80,7 +77,6 @@ class TestStatesAPI:
         response = test_client.get("/states/CAL")
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_create_state_success(self, test_client, clean_db):
         """Test POST /states with valid data."""
         state_data = {
@@ -128,7 +124,6 @@ class TestStatesAPI:
         })
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_update_state_success(self, test_client, sample_states):
         """Test PUT /states/{state_id} with valid data."""
         # Get a state to update
@@ -167,7 +162,6 @@ class TestStatesAPI:
         })
         assert response.status_code == 422
 
-    @pytest.mark.asyncio 
     async def test_delete_state_success(self, test_client, clean_db):
         """Test DELETE /states/{state_id} with state that has no municipalities."""
         # Create a state
@@ -182,7 +176,6 @@ class TestStatesAPI:
         data = response.json()
         assert "deleted successfully" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_delete_state_with_municipalities(self, test_client, sample_states, sample_municipalities):
         """Test DELETE /states/{state_id} with state that has municipalities."""
         # Try to delete California (which has municipalities)
@@ -206,7 +199,6 @@ class TestStatesAPI:
         response = test_client.get("/states")
         assert response.headers["content-type"] == "application/json"
 
-    @pytest.mark.asyncio
     async def test_states_api_cors_headers(self, test_client, sample_states):
         """Test CORS headers are present in responses."""
         response = test_client.get("/states")
@@ -221,7 +213,6 @@ class TestStatesAPI:
         # Note: Actual CORS headers depend on FastAPI CORS middleware configuration
         # This test verifies the structure is in place
 
-    @pytest.mark.asyncio
     async def test_states_api_performance(self, test_client, sample_states):
         """Test basic performance of states API."""
         import time
@@ -233,7 +224,6 @@ class TestStatesAPI:
         assert response.status_code == 200
         assert duration < 1.0  # Should respond in under 1 second
 
-    @pytest.mark.asyncio
     async def test_states_api_pagination_structure(self, test_client, sample_states):
         """Test that states API returns proper pagination structure."""
         response = test_client.get("/states")
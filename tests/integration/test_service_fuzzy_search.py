@@ -0,0 +1,273 @@
+"""
+Fuzzy search query checks against a live PostgreSQL database.
+
+These run the service's fuzzy search SQL (pg_trgm similarity plus soundex)
+directly through asyncpg, sharing one connection pool for the whole session.
+They are skipped when the configured database cannot be reached.
+"""
+
+import logging
+import time
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.integration, pytest.mark.database, pytest.mark.fuzzy]
+
+# The score is computed once in a subquery and filtered by alias, rather
+# than being re-evaluated in a HAVING clause. soundex($1) is bound once in
+# the params CTE instead of being recomputed for every scanned row.
+FUZZY_ADDRESS_SQL = """
+    WITH params AS (SELECT soundex($1) AS sx)
+    SELECT full_address, similarity_score
+    FROM (
+        SELECT DISTINCT
+            full_address,
+            GREATEST(
+                similarity(street_address, $1),
+                similarity(street_name, $1),
+                CASE
+                    WHEN soundex(street_name) = params.sx THEN 0.8
+                    ELSE 0.0
+                END
+            ) as similarity_score
+        FROM addresses, params
+        WHERE
+            (street_address % $1)
+            OR (street_name % $1)
+            OR soundex(street_name) = params.sx
+    ) scored
+    WHERE similarity_score >= 0.3
+    ORDER BY similarity_score DESC, full_address
+    LIMIT 5
+"""
+
+STREET_NAME_SQL = """
+    WITH params AS (SELECT soundex($1) AS sx)
+    SELECT street_name, address_count, similarity_score
+    FROM (
+        SELECT
+            street_name,
+            COUNT(*) as address_count,
+            GREATEST(
+                similarity(street_name, $1),
+                CASE
+                    WHEN soundex(street_name) = params.sx THEN 0.7
+                    ELSE 0.0
+                END
+            ) as similarity_score
+        FROM addresses, params
+        WHERE
+            (street_name % $1)
+            OR soundex(street_name) = params.sx
+        GROUP BY street_name, params.sx
+    ) scored
+    WHERE similarity_score >= 0.4
+    ORDER BY similarity_score DESC, address_count DESC, street_name
+    LIMIT 5
+"""
+
+AUTOCOMPLETE_SQL = """
+    SELECT full_address, score
+    FROM (
+        SELECT DISTINCT full_address,
+               GREATEST(
+                   similarity(street_address, $1),
+                   similarity(full_address, $1)
+               ) as score
+        FROM addresses
+        WHERE street_address % $1
+           OR full_address % $1
+    ) scored
+    WHERE score >= 0.2
+    ORDER BY score DESC, full_address
+    LIMIT 5
+"""
+
+# Counts matches at every threshold in a single pass over addresses
+THRESHOLD_COUNTS_SQL = """
+    SELECT
+        COUNT(*) FILTER (WHERE s >= 0.1) AS t1,
+        COUNT(*) FILTER (WHERE s >= 0.3) AS t3,
+        COUNT(*) FILTER (WHERE s >= 0.5) AS t5,
+        COUNT(*) FILTER (WHERE s >= 0.7) AS t7,
+        COUNT(*) FILTER (WHERE s >= 0.9) AS t9
+    FROM (SELECT similarity(street_name, $1) AS s FROM addresses) scored
+"""
+
+ILIKE_COUNT_SQL = """
+    SELECT COUNT(*) FROM addresses
+    WHERE street_name ILIKE $1 OR street_address ILIKE $1
+"""
+
+TRIGRAM_COUNT_SQL = """
+    SELECT COUNT(*) FROM addresses
+    WHERE street_name % $1 OR street_address % $1
+"""
+
+SIMILARITY_COUNT_SQL = """
+    SELECT COUNT(*) FROM addresses
+    WHERE similarity(street_name, $1) > 0.3
+       OR similarity(street_address, $1) > 0.3
+"""
+
+TRIGRAM_INDEX_CHECK_SQL = """
+    SELECT 1 FROM pg_indexes
+    WHERE tablename = 'addresses' AND indexdef ILIKE '%gin_trgm_ops%'
+    LIMIT 1
+"""
+
+CREATE_TRIGRAM_INDEXES_SQL = """
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS ix_addresses_street_name_trgm
+        ON addresses USING GIN (street_name gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS ix_addresses_street_address_trgm
+        ON addresses USING GIN (street_address gin_trgm_ops);
+"""
+
+
+@pytest_asyncio.fixture(scope="session")
+async def pg_pool(config):
+    """Connection pool shared by every fuzzy search check in the session."""
+    try:
+        pool = await asyncpg.create_pool(config.database.url, min_size=4, max_size=8)
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Database not available: {e}")
+    async with pool.acquire() as conn:
+        # Without the trigram indexes every probe falls back to a sequential
+        # scan and the timings below are meaningless, so make sure the ones
+        # from migration 003 are present before anything runs
+        if not await conn.fetchval(TRIGRAM_INDEX_CHECK_SQL):
+            await conn.execute(CREATE_TRIGRAM_INDEXES_SQL)
+    yield pool
+    await pool.close()
+
+
+async def _fetch(pool, sql, *args):
+    """Run one probe on its own pooled connection.
+    
+    asyncpg caches prepared statements per connection, so each connection
+    parses and plans a given query only once.
+    """
+    async with pool.acquire() as conn:
+        return await conn.fetch(sql, *args)
+
+
+@pytest.mark.parametrize("search_query,description", [
+    ("Main Street", "Exact match"),
+    ("Main Stret", "Single typo"),
+    ("Oak Ave", "Abbreviated form"),
+    ("Lincoln Blvd", "Different abbreviation"),
+    ("123 Park", "Partial address with number"),
+    ("Garfield Dr", "Drive abbreviation"),
+])
+async def test_fuzzy_address_search(pg_pool, search_query, description):
+    """Fuzzy address search returns at most 5 matches above the threshold."""
+    fuzzy_results = await _fetch(pg_pool, FUZZY_ADDRESS_SQL, search_query)
+    
+    logger.debug("%s: '%s' -> %d fuzzy matches", description, search_query, len(fuzzy_results))
+    for row in fuzzy_results[:3]:
+        logger.debug("  %s (score: %.3f)", row['full_address'], row['similarity_score'])
+    
+    assert len(fuzzy_results) <= 5
+    assert all(row['similarity_score'] >= 0.3 for row in fuzzy_results)
+
+
+@pytest.mark.parametrize("search_query,description", [
+    ("Main", "Common name"),
+    ("Oak", "Tree name"),
+    ("Garfeld", "Typo in name"),
+    ("Lincon", "Historical name typo"),
+])
+async def test_fuzzy_street_name_search(pg_pool, search_query, description):
+    """Fuzzy street name search groups matches by street name."""
+    street_results = await _fetch(pg_pool, STREET_NAME_SQL, search_query)
+    
+    logger.debug("%s: '%s' -> %d street name matches", description, search_query, len(street_results))
+    for row in street_results:
+        logger.debug("  %s (%d addresses, score: %.3f)",
+                     row['street_name'], row['address_count'], row['similarity_score'])
+    
+    assert len(street_results) <= 5
+    assert all(row['similarity_score'] >= 0.4 for row in street_results)
+    assert len({row['street_name'] for row in street_results}) == len(street_results)
+
+
+@pytest.mark.parametrize("search_query,description", [
+    ("123", "House number"),
+    ("123 M", "Number + letter"),
+    ("Ma", "Partial street name"),
+    ("Main", "Full street name"),
+    ("Oak Av", "Name + partial type"),
+    ("lincoln b", "Name + partial type (lowercase)"),
+])
+async def test_fuzzy_autocomplete(pg_pool, search_query, description):
+    """Fuzzy autocomplete returns at most 5 matches above the threshold."""
+    autocomplete_results = await _fetch(pg_pool, AUTOCOMPLETE_SQL, search_query)
+    
+    logger.debug("%s: '%s' -> %d autocomplete matches", description, search_query, len(autocomplete_results))
+    for row in autocomplete_results[:3]:
+        logger.debug("  %s (score: %.3f)", row['full_address'], row['score'])
+    
+    assert len(autocomplete_results) <= 5
+    assert all(row['score'] >= 0.2 for row in autocomplete_results)
+
+
+async def test_trigram_indexes_present(pg_pool):
+    """The fuzzy search columns are covered by GIN trigram indexes."""
+    async with pg_pool.acquire() as conn:
+        indexdefs = await conn.fetch(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = 'addresses'"
+        )
+    trigram_indexes = [row['indexdef'] for row in indexdefs if 'gin_trgm_ops' in row['indexdef']]
+    
+    assert any('(street_name gin_trgm_ops)' in indexdef for indexdef in trigram_indexes)
+    assert any('(street_address gin_trgm_ops)' in indexdef for indexdef in trigram_indexes)
+
+
+async def test_search_variant_counts(pg_pool):
+    """ILIKE, trigram and similarity searches can all be counted."""
+    search_term = "Main Street"
+    
+    async with pg_pool.acquire() as conn:
+        # Prepare every variant up front so the timings below measure
+        # execution only, not parsing and planning
+        ilike_stmt = await conn.prepare(ILIKE_COUNT_SQL)
+        fuzzy_stmt = await conn.prepare(TRIGRAM_COUNT_SQL)
+        sim_stmt = await conn.prepare(SIMILARITY_COUNT_SQL)
+        
+        start = time.perf_counter()
+        ilike_count = await ilike_stmt.fetchval(f"%{search_term}%")
+        ilike_time = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        fuzzy_count = await fuzzy_stmt.fetchval(search_term)
+        fuzzy_time = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        sim_count = await sim_stmt.fetchval(search_term)
+        sim_time = (time.perf_counter() - start) * 1000
+    
+    logger.debug("ILIKE search:      %4d results in %6.2fms", ilike_count, ilike_time)
+    logger.debug("Trigram search:    %4d results in %6.2fms", fuzzy_count, fuzzy_time)
+    logger.debug("Similarity search: %4d results in %6.2fms", sim_count, sim_time)
+    
+    assert min(ilike_count, fuzzy_count, sim_count) >= 0
+
+
+async def test_similarity_threshold_counts(pg_pool):
+    """Raising the similarity threshold never adds matches."""
+    typo_query = "Main Stret"  # Intentional typo
+    thresholds = [0.1, 0.3, 0.5, 0.7, 0.9]
+    
+    async with pg_pool.acquire() as conn:
+        threshold_counts = await conn.fetchrow(THRESHOLD_COUNTS_SQL, typo_query)
+    result_counts = list(threshold_counts.values())
+    
+    for threshold, result_count in zip(thresholds, result_counts):
+        logger.debug("Threshold %.1f: %3d matches for '%s'", threshold, result_count, typo_query)
+    
+    assert result_counts == sorted(result_counts, reverse=True)
@@ -3,10 +3,38 @@ Unit tests for AddressService.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, MagicMock, DEFAULT
+import lightspun.services.address_service as _svc
 from lightspun.services.address_service import AddressService
 from lightspun.schemas import Address, AddressCreate, AddressUpdate, AddressCreateMinimal
 from lightspun.core.address_processing import AddressComponents
+from utils import DatabaseTestHelper
+
+
+@pytest.fixture(autouse=True)
+def mocked_db(monkeypatch):
+    """Install one mock for the database handle and DatabaseOperations per test."""
+    db = AsyncMock()
+    ops = AsyncMock()
+    monkeypatch.setattr(_svc.db, "database", db)
+    monkeypatch.setattr(_svc, "DatabaseOperations", ops)
+    return SimpleNamespace(db=db, ops=ops)
+
+
+@pytest.fixture
+def fuzzy_mocks():
+    """Patch the fuzzy search config and engine together for a single test."""
+    with patch.multiple(_svc, FuzzySearchConfig=DEFAULT, AddressFuzzySearch=DEFAULT) as mocks:
+        # The service awaits the searcher's methods
+        mocks['AddressFuzzySearch'].return_value = AsyncMock()
+        yield mocks
+
+
+@pytest.fixture(scope="session")
+def mock_address(mock_address_data):
+    """Pre-built Address for the first mock row; curated data, so validation is skipped."""
+    return Address.model_construct(**mock_address_data[0])
 
 
 @pytest.mark.unit
@@ -14,92 +42,76 @@ from lightspun.core.address_processing import AddressComponents
 class TestAddressService:
     """Test suite for AddressService."""
 
-    @pytest.mark.asyncio
-    async def test_get_address_by_id_success(self, mock_address_data):
+    async def test_get_address_by_id_success(self, mock_address_data, mocked_db):
         """Test successful retrieval of address by ID."""
-        mock_result = mock_address_data[0]
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.get_by_id.return_value = mock_address_data[0]
         
-        with patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_by_id.return_value = mock_result
-            
-            result = await AddressService.get_address_by_id(1)
-            
-            assert isinstance(result, Address)
-            assert result.street_address == "123 Main Street"
-            assert result.city == "Los Angeles"
-            
-            # Verify DatabaseOperations call
-            mock_db_ops.get_by_id.assert_called_once_with(
-                table="addresses",
-                id_value=1,
-                fields=["id", "street_number", "street_name", "unit", "street_address", "city", "state_code", "full_address"]
-            )
+        result = await AddressService.get_address_by_id(1)
+        
+        assert isinstance(result, Address)
+        assert result.street_address == "123 Main Street"
+        assert result.city == "Los Angeles"
+        
+        # Verify DatabaseOperations call
+        mock_db_ops.get_by_id.assert_called_once_with(
+            table="addresses",
+            id_value=1,
+            fields=["id", "street_number", "street_name", "unit", "street_address", "city", "state_code", "full_address"]
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_address_by_id_not_found(self):
+    async def test_get_address_by_id_not_found(self, mocked_db):
         """Test retrieval of non-existent address by ID."""
-        with patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_by_id.return_value = None
-            
-            result = await AddressService.get_address_by_id(999)
-            
-            assert result is None
+        mocked_db.ops.get_by_id.return_value = None
+        
+        result = await AddressService.get_address_by_id(999)
+        
+        assert result is None
 
-    @pytest.mark.asyncio
-    async def test_search_addresses_by_city(self, mock_address_data):
+    async def test_search_addresses_by_city(self, mock_address_rows, mocked_db):
         """Test searching addresses by city."""
+        mock_db = mocked_db.db
         # Filter addresses for Los Angeles
-        la_addresses = [addr for addr in mock_address_data if addr["city"] == "Los Angeles"]
-        mock_rows = [MagicMock(**addr) for addr in la_addresses]
+        mock_db.fetch_all.return_value = [row for row in mock_address_rows if row.city == "Los Angeles"]
         
-        with patch('lightspun.services.address_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await AddressService.search_addresses_by_city("Los Angeles", limit=10)
-            
-            assert len(result) == 1
-            assert all(isinstance(addr, Address) for addr in result)
-            assert all(addr.city == "Los Angeles" for addr in result)
-            
-            # Verify database call
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert values['city'] == "Los Angeles"
-            assert values['limit'] == 10
+        result = await AddressService.search_addresses_by_city("Los Angeles", limit=10)
+        
+        assert len(result) == 1
+        assert all(isinstance(addr, Address) for addr in result)
+        assert all(addr.city == "Los Angeles" for addr in result)
+        
+        # Verify database call
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['city'] == "Los Angeles"
+        assert values['limit'] == 10
 
-    @pytest.mark.asyncio
-    async def test_search_addresses_by_city_default_limit(self):
+    async def test_search_addresses_by_city_default_limit(self, mocked_db):
         """Test searching addresses by city with default limit."""
-        with patch('lightspun.services.address_service.database') as mock_db:
-            mock_db.fetch_all.return_value = []
-            
-            await AddressService.search_addresses_by_city("Test City")
-            
-            call_args = mock_db.fetch_all.call_args
-            assert call_args[1]['values']['limit'] == 50  # Default limit
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = []
+        
+        await AddressService.search_addresses_by_city("Test City")
+        
+        assert mock_db.fetch_all.call_args.kwargs['values']['limit'] == 50  # Default limit
 
-    @pytest.mark.asyncio
-    async def test_search_addresses_by_state(self, mock_address_data):
+    async def test_search_addresses_by_state(self, mock_address_rows, mocked_db):
         """Test searching addresses by state code."""
-        mock_rows = [MagicMock(**addr) for addr in mock_address_data]
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_address_rows
         
-        with patch('lightspun.services.address_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await AddressService.search_addresses_by_state("ca", limit=25)
-            
-            assert len(result) == 2
-            assert all(isinstance(addr, Address) for addr in result)
-            
-            # Verify state code was converted to uppercase
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert values['state_code'] == "CA"
-            assert values['limit'] == 25
+        result = await AddressService.search_addresses_by_state("ca", limit=25)
+        
+        assert len(result) == 2
+        assert all(isinstance(addr, Address) for addr in result)
+        
+        # Verify state code was converted to uppercase
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['state_code'] == "CA"
+        assert values['limit'] == 25
 
-    @pytest.mark.asyncio
-    async def test_create_address_success(self):
+    async def test_create_address_success(self, monkeypatch, mocked_db):
         """Test successful address creation."""
+        monkeypatch.setattr(_svc, 'standardize_street_type', lambda s: "Main Street")
         address_data = AddressCreate(
             street_number="123",
             street_name="Main St",
@@ -125,12 +137,11 @@ class TestAddressService:
             street_name="Main Street",
             unit=None
         )
+        mock_db_ops = mocked_db.ops
         
         with patch('lightspun.services.address_service.AddressParser') as mock_parser, \
              patch('lightspun.services.address_service.AddressValidator') as mock_validator, \
-             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter, \
-             patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops, \
-             patch('lightspun.services.address_service.standardize_street_type', return_value="Main Street"):
+             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter:
             
             # Mock parser
             mock_parser_instance = mock_parser.return_value
@@ -153,22 +164,19 @@ class TestAddressService:
             assert result.street_name == "Main Street"
             assert result.full_address == "123 Main Street, Los Angeles, CA"
 
-    @pytest.mark.asyncio
-    async def test_create_address_validation_failure(self):
+    async def test_create_address_validation_failure(self, mocked_db):
         """Test address creation with validation failure."""
+        # The schema already rejects empty fields, so use a well-formed
+        # address and let the (mocked) validator reject it
         address_data = AddressCreate(
-            street_address="",
-            city="",
-            state_code=""
+            street_number="123",
+            street_name="Main St",
+            street_address="123 Main St",
+            city="Los Angeles",
+            state_code="CA"
         )
         
-        with patch('lightspun.services.address_service.AddressParser') as mock_parser, \
-             patch('lightspun.services.address_service.AddressValidator') as mock_validator:
-            
-            # Mock parser
-            mock_parser_instance = mock_parser.return_value
-            mock_parser_instance.parse_street_address.return_value = AddressComponents()
-            
+        with patch('lightspun.services.address_service.AddressValidator') as mock_validator:
             # Mock validator failure
             mock_validator_instance = mock_validator.return_value
             mock_validator_instance.validate_complete_address.return_value = MagicMock(
@@ -178,9 +186,10 @@ class TestAddressService:
             
             with pytest.raises(ValueError, match="Invalid address: Street address is required; City is required"):
                 await AddressService.create_address(address_data)
+        
+        mocked_db.ops.create.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_create_address_minimal_success(self):
+    async def test_create_address_minimal_success(self, mocked_db):
         """Test successful minimal address creation."""
         address_data = AddressCreateMinimal(
             street_address="123 Main St",
@@ -204,10 +213,10 @@ class TestAddressService:
             street_name="Main Street",
             unit=None
         )
+        mock_db_ops = mocked_db.ops
         
         with patch('lightspun.services.address_service.AddressParser') as mock_parser, \
-             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter, \
-             patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
+             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter:
             
             # Mock parser
             mock_parser_instance = mock_parser.return_value
@@ -225,21 +234,21 @@ class TestAddressService:
             assert isinstance(result, Address)
             assert result.street_address == "123 Main St"
 
-    @pytest.mark.asyncio
-    async def test_update_address_success(self, mock_address_data):
+    async def test_update_address_success(self, mock_address_data, mock_address, monkeypatch, mocked_db):
         """Test successful address update."""
+        monkeypatch.setattr(_svc, 'standardize_street_type', lambda s: "New Street Name")
         address_data = AddressUpdate(street_name="New Street Name")
-        mock_current_address = Address(**mock_address_data[0])
+        mock_current_address = mock_address
         
         mock_result = {
             **mock_address_data[0],
             "street_name": "New Street Name"
         }
         
+        mock_db_ops = mocked_db.ops
+        
         with patch.object(AddressService, 'get_address_by_id', return_value=mock_current_address), \
-             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter, \
-             patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops, \
-             patch('lightspun.services.address_service.standardize_street_type', return_value="New Street Name"):
+             patch('lightspun.services.address_service.AddressFormatter') as mock_formatter:
             
             # Mock formatter
             mock_formatter_instance = mock_formatter.return_value
@@ -252,31 +261,22 @@ class TestAddressService:
             assert isinstance(result, Address)
             assert result.street_name == "New Street Name"
 
-    @pytest.mark.asyncio
-    async def test_update_address_no_changes(self):
+    async def test_update_address_no_changes(self, mock_address, mocked_db):
         """Test address update with no changes."""
         address_data = AddressUpdate()  # No fields set
-        mock_current_address = Address(
-            id=1,
-            street_address="123 Main Street",
-            city="Los Angeles",
-            state_code="CA",
-            full_address="123 Main Street, Los Angeles, CA"
-        )
         
-        with patch.object(AddressService, 'get_address_by_id', return_value=mock_current_address):
+        with patch.object(AddressService, 'get_address_by_id', return_value=mock_address):
             result = await AddressService.update_address(1, address_data)
             
-            assert result == mock_current_address
+            assert result == mock_address
+        
+        mocked_db.ops.update_by_id.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_delete_address_success(self, mock_address_data):
+    async def test_delete_address_success(self, mock_address, mocked_db):
         """Test successful address deletion."""
-        mock_address = Address(**mock_address_data[0])
+        mock_db_ops = mocked_db.ops
         
-        with patch.object(AddressService, 'get_address_by_id', return_value=mock_address), \
-             patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
-            
+        with patch.object(AddressService, 'get_address_by_id', return_value=mock_address):
             mock_db_ops.delete_by_id.return_value = True
             
             result = await AddressService.delete_address(1)
@@ -284,116 +284,90 @@ class TestAddressService:
             assert result is True
             mock_db_ops.delete_by_id.assert_called_once_with("addresses", 1)
 
-    @pytest.mark.asyncio
     async def test_delete_address_not_found(self):
         """Test deletion of non-existent address."""
         with patch.object(AddressService, 'get_address_by_id', return_value=None):
             result = await AddressService.delete_address(999)
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_search_addresses_by_street_name(self, mock_address_data):
+    async def test_search_addresses_by_street_name(self, mock_address_rows, mocked_db, monkeypatch):
         """Test searching addresses by street name."""
+        monkeypatch.setattr(_svc, 'standardize_street_type', lambda s: "Main Street")
+        mock_db = mocked_db.db
         # Filter for Main Street addresses
-        main_street_addresses = [addr for addr in mock_address_data if "Main" in addr["street_name"]]
-        mock_rows = [MagicMock(**addr) for addr in main_street_addresses]
+        mock_db.fetch_all.return_value = [row for row in mock_address_rows if "Main" in row.street_name]
         
-        with patch('lightspun.services.address_service.database') as mock_db, \
-             patch('lightspun.services.address_service.standardize_street_type', return_value="Main Street"):
-            
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await AddressService.search_addresses_by_street_name("Main St", limit=10)
-            
-            assert len(result) == 1
-            assert all(isinstance(addr, Address) for addr in result)
-            
-            # Verify standardization was applied
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert "Main Street" in values['street_name']
+        result = await AddressService.search_addresses_by_street_name("Main St", limit=10)
+        
+        assert len(result) == 1
+        assert all(isinstance(addr, Address) for addr in result)
+        
+        # Verify standardization was applied
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert "Main Street" in values['street_name']
 
-    @pytest.mark.asyncio
-    async def test_search_addresses_by_street_number(self, mock_address_data):
+    async def test_search_addresses_by_street_number(self, mock_address_rows, mocked_db):
         """Test searching addresses by street number."""
+        mock_db = mocked_db.db
         # Filter for addresses with number "123"
-        filtered_addresses = [addr for addr in mock_address_data if addr["street_number"] == "123"]
-        mock_rows = [MagicMock(**addr) for addr in filtered_addresses]
+        mock_db.fetch_all.return_value = [row for row in mock_address_rows if row.street_number == "123"]
         
-        with patch('lightspun.services.address_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await AddressService.search_addresses_by_street_number("123", limit=15)
-            
-            assert len(result) == 1
-            assert result[0].street_number == "123"
-            
-            # Verify query parameters
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert values['street_number'] == "123"
-            assert values['limit'] == 15
+        result = await AddressService.search_addresses_by_street_number("123", limit=15)
+        
+        assert len(result) == 1
+        assert result[0].street_number == "123"
+        
+        # Verify query parameters
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['street_number'] == "123"
+        assert values['limit'] == 15
 
-    @pytest.mark.asyncio
-    async def test_fuzzy_search_addresses(self):
+    async def test_fuzzy_search_addresses(self, fuzzy_mocks):
         """Test fuzzy address search."""
         mock_suggestions = ["123 Main Street, Los Angeles, CA", "124 Main Street, Los Angeles, CA"]
         
-        with patch('lightspun.services.address_service.FuzzySearchConfig') as mock_config, \
-             patch('lightspun.services.address_service.AddressFuzzySearch') as mock_searcher:
-            
-            mock_searcher_instance = mock_searcher.return_value
-            mock_searcher_instance.search_addresses.return_value = mock_suggestions
-            
-            result = await AddressService.fuzzy_search_addresses("Main St", limit=5, min_similarity=0.4)
-            
-            assert result == mock_suggestions
-            
-            # Verify configuration
-            mock_config.assert_called_once_with(min_similarity=0.4, limit=5)
-            mock_searcher_instance.search_addresses.assert_called_once_with("Main St", 5)
+        mock_searcher_instance = fuzzy_mocks['AddressFuzzySearch'].return_value
+        mock_searcher_instance.search_addresses.return_value = mock_suggestions
+        
+        result = await AddressService.fuzzy_search_addresses("Main St", limit=5, min_similarity=0.4)
+        
+        assert result == mock_suggestions
+        
+        # Verify configuration
+        fuzzy_mocks['FuzzySearchConfig'].assert_called_once_with(min_similarity=0.4, limit=5)
+        mock_searcher_instance.search_addresses.assert_awaited_once_with("Main St", 5)
 
-    @pytest.mark.asyncio
-    async def test_autocomplete_addresses_with_fuzzy(self):
+    async def test_autocomplete_addresses_with_fuzzy(self, fuzzy_mocks):
         """Test address autocomplete with fuzzy search enabled."""
         mock_suggestions = ["123 Main Street, Los Angeles, CA"]
         
-        with patch('lightspun.services.address_service.FuzzySearchConfig') as mock_config, \
-             patch('lightspun.services.address_service.AddressFuzzySearch') as mock_searcher:
-            
-            mock_searcher_instance = mock_searcher.return_value
-            mock_searcher_instance.autocomplete.return_value = mock_suggestions
-            
-            result = await AddressService.autocomplete_addresses("Main", limit=8, use_fuzzy=True)
-            
-            assert result == mock_suggestions
-            mock_searcher_instance.autocomplete.assert_called_once_with("Main", 8)
+        mock_searcher_instance = fuzzy_mocks['AddressFuzzySearch'].return_value
+        mock_searcher_instance.autocomplete.return_value = mock_suggestions
+        
+        result = await AddressService.autocomplete_addresses("Main", limit=8, use_fuzzy=True)
+        
+        assert result == mock_suggestions
+        mock_searcher_instance.autocomplete.assert_awaited_once_with("Main", 8, state_code=None, city=None)
 
-    @pytest.mark.asyncio
-    async def test_autocomplete_addresses_without_fuzzy(self):
+    async def test_autocomplete_addresses_without_fuzzy(self, mocked_db, monkeypatch):
         """Test address autocomplete with fuzzy search disabled."""
-        mock_rows = [
-            MagicMock(full_address="123 Main Street, Los Angeles, CA"),
-            MagicMock(full_address="124 Main Street, Los Angeles, CA")
-        ]
+        monkeypatch.setattr(_svc, 'standardize_street_type', lambda s: "Main Street")
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = DatabaseTestHelper.create_mock_rows([
+            {"full_address": "123 Main Street, Los Angeles, CA"},
+            {"full_address": "124 Main Street, Los Angeles, CA"}
+        ])
         
-        with patch('lightspun.services.address_service.database') as mock_db, \
-             patch('lightspun.services.address_service.standardize_street_type', return_value="Main Street"):
-            
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await AddressService.autocomplete_addresses("Main", limit=5, use_fuzzy=False)
-            
-            assert len(result) == 2
-            assert "123 Main Street, Los Angeles, CA" in result
-            
-            # Verify exact matching query was used
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert values['prefix_term'] == "Main%"
-            assert values['std_prefix_term'] == "Main Street%"
+        result = await AddressService.autocomplete_addresses("Main", limit=5, use_fuzzy=False)
+        
+        assert len(result) == 2
+        assert "123 Main Street, Los Angeles, CA" in result
+        
+        # Verify exact matching query was used
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['prefix_term'] == "Main%"
+        assert values['std_prefix_term'] == "Main Street%"
 
-    @pytest.mark.asyncio
     async def test_autocomplete_addresses_short_query(self):
         """Test address autocomplete with query too short."""
         result = await AddressService.autocomplete_addresses("M", limit=10)
@@ -402,45 +376,39 @@ class TestAddressService:
         result = await AddressService.autocomplete_addresses("", limit=10)
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_all_addresses(self, mock_address_data):
+    async def test_get_all_addresses(self, mock_address_data, mocked_db):
         """Test retrieving all addresses."""
-        mock_results = mock_address_data
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.get_all.return_value = mock_address_data
         
-        with patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_all.return_value = mock_results
-            
-            result = await AddressService.get_all_addresses(limit=500)
-            
-            assert len(result) == 2
-            assert all(isinstance(addr, Address) for addr in result)
-            
-            # Verify call parameters
-            mock_db_ops.get_all.assert_called_once_with(
-                table="addresses",
-                fields=["id", "street_number", "street_name", "unit", "street_address", "city", "state_code", "full_address"],
-                order_by=["state_code", "city", "street_name", "street_number"],
-                limit=500
-            )
+        result = await AddressService.get_all_addresses(limit=500)
+        
+        assert len(result) == 2
+        assert all(isinstance(addr, Address) for addr in result)
+        
+        # Verify call parameters
+        mock_db_ops.get_all.assert_called_once_with(
+            table="addresses",
+            fields=["id", "street_number", "street_name", "unit", "street_address", "city", "state_code", "full_address"],
+            order_by=["state_code", "city", "street_name", "street_number"],
+            limit=500
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_all_addresses_default_limit(self):
+    async def test_get_all_addresses_default_limit(self, mocked_db):
         """Test retrieving all addresses with default limit."""
-        with patch('lightspun.services.address_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_all.return_value = []
-            
-            await AddressService.get_all_addresses()
-            
-            call_args = mock_db_ops.get_all.call_args
-            assert call_args[1]['limit'] == 1000  # Default limit
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.get_all.return_value = []
+        
+        await AddressService.get_all_addresses()
+        
+        assert mock_db_ops.get_all.call_args.kwargs['limit'] == 1000  # Default limit
 
-    @pytest.mark.asyncio
     async def test_search_addresses_alias(self):
-        """Test that search_addresses is an alias for autocomplete_addresses."""
+        """Test that search_addresses delegates to exact-match autocomplete_addresses."""
         mock_suggestions = ["123 Main Street, Los Angeles, CA"]
         
         with patch.object(AddressService, 'autocomplete_addresses', return_value=mock_suggestions) as mock_autocomplete:
             result = await AddressService.search_addresses("Main", limit=5)
             
             assert result == mock_suggestions
-            mock_autocomplete.assert_called_once_with("Main", 5, use_fuzzy=True)
\ No newline at end of file
+            mock_autocomplete.assert_awaited_once_with("Main", 5, use_fuzzy=False, state_code=None, city=None)
\ No newline at end of file
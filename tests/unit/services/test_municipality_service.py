@@ -3,134 +3,138 @@ Unit tests for MunicipalityService.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+import lightspun.services.municipality_service as _svc
+import lightspun.services.state_service as _state_svc
 from lightspun.services.municipality_service import MunicipalityService
+from lightspun.services.state_service import StateService
 from lightspun.schemas import Municipality, MunicipalityCreate, MunicipalityUpdate
 
 
+@pytest.fixture(autouse=True)
+def mocked_db(monkeypatch):
+    """Install one mock for the database handle and DatabaseOperations per test."""
+    db = AsyncMock()
+    ops = AsyncMock()
+    monkeypatch.setattr(_svc.db, "database", db)
+    monkeypatch.setattr(_svc, "DatabaseOperations", ops)
+    MunicipalityService.clear_state_cache()
+    return SimpleNamespace(db=db, ops=ops)
+
+
+@pytest.fixture(scope="session")
+def la_city():
+    """Los Angeles municipality stub; known-good data, so validation is skipped."""
+    return Municipality.model_construct(id=1, name="Los Angeles", type="city", state_id=1)
+
+
 @pytest.mark.unit
 @pytest.mark.municipality
 class TestMunicipalityService:
     """Test suite for MunicipalityService."""
 
-    @pytest.mark.asyncio
-    async def test_get_municipalities_by_state_code_success(self, mock_municipality_data):
+    async def test_get_municipalities_by_state_code_success(self, mock_municipality_rows, mocked_db):
         """Test successful retrieval of municipalities by state code."""
-        mock_rows = [MagicMock(**municipality) for municipality in mock_municipality_data]
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_municipality_rows
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.get_municipalities_by_state_code("CA")
-            
-            assert len(result) == 3
-            assert all(isinstance(municipality, Municipality) for municipality in result)
-            assert result[0].name == "Los Angeles"
-            
-            # Verify database call with uppercase state code
-            call_args = mock_db.fetch_all.call_args
-            assert call_args[1]['values']['state_code'] == "CA"
+        result = await MunicipalityService.get_municipalities_by_state_code("CA")
+        
+        assert len(result) == 3
+        assert all(isinstance(municipality, Municipality) for municipality in result)
+        assert result[0].name == "Los Angeles"
+        
+        # Verify database call with uppercase state code
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['state_code'] == "CA"
 
-    @pytest.mark.asyncio
-    async def test_get_municipalities_by_state_code_empty(self):
+    async def test_get_municipalities_by_state_code_empty(self, mocked_db):
         """Test retrieval when no municipalities exist for state."""
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = []
-            
-            result = await MunicipalityService.get_municipalities_by_state_code("XX")
-            
-            assert result == []
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = []
+        
+        result = await MunicipalityService.get_municipalities_by_state_code("XX")
+        
+        assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_municipalities_by_state_id_success(self, mock_municipality_data):
+    async def test_get_municipalities_by_state_id_success(self, mock_municipality_rows, mocked_db):
         """Test successful retrieval of municipalities by state ID."""
-        mock_rows = [MagicMock(**municipality) for municipality in mock_municipality_data]
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_municipality_rows
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.get_municipalities_by_state_id(1)
-            
-            assert len(result) == 3
-            assert all(isinstance(municipality, Municipality) for municipality in result)
-            
-            # Verify database call
-            call_args = mock_db.fetch_all.call_args
-            assert call_args[1]['values']['state_id'] == 1
+        result = await MunicipalityService.get_municipalities_by_state_id(1)
+        
+        assert len(result) == 3
+        assert all(isinstance(municipality, Municipality) for municipality in result)
+        
+        # Verify database call
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['state_id'] == 1
 
-    @pytest.mark.asyncio
-    async def test_search_municipalities_by_name(self, mock_municipality_data):
+    async def test_search_municipalities_by_name(self, mock_municipality_rows, mocked_db):
         """Test searching municipalities by name."""
-        filtered_data = [mock_municipality_data[0]]  # Only Los Angeles
-        mock_rows = [MagicMock(**municipality) for municipality in filtered_data]
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_municipality_rows[:1]  # Only Los Angeles
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.search_municipalities_by_name("angeles", limit=10)
-            
-            assert len(result) == 1
-            assert result[0].name == "Los Angeles"
-            
-            # Verify query parameters
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert "angeles%" in values['prefix_term']
-            assert "%angeles%" in values['contains_term']
-            assert values['limit'] == 10
+        result = await MunicipalityService.search_municipalities_by_name("angeles", limit=10)
+        
+        assert len(result) == 1
+        assert result[0].name == "Los Angeles"
+        
+        # Verify query parameters
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert "angeles%" in values['prefix_term']
+        assert "%angeles%" in values['contains_term']
+        assert values['limit'] == 10
 
-    @pytest.mark.asyncio
-    async def test_search_municipalities_by_name_default_limit(self):
+    async def test_search_municipalities_by_name_default_limit(self, mocked_db):
         """Test searching municipalities by name with default limit."""
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = []
-            
-            await MunicipalityService.search_municipalities_by_name("test")
-            
-            call_args = mock_db.fetch_all.call_args
-            assert call_args[1]['values']['limit'] == 20  # Default limit
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = []
+        
+        await MunicipalityService.search_municipalities_by_name("test")
+        
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['limit'] == 20  # Default limit
 
-    @pytest.mark.asyncio
-    async def test_get_municipality_by_id_success(self, mock_municipality_data):
+    async def test_get_municipality_by_id_success(self, mock_municipality_data, mocked_db):
         """Test successful retrieval of municipality by ID."""
         mock_result = mock_municipality_data[0]
         
-        with patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_by_id.return_value = mock_result
-            
-            result = await MunicipalityService.get_municipality_by_id(1)
-            
-            assert isinstance(result, Municipality)
-            assert result.name == "Los Angeles"
-            
-            # Verify DatabaseOperations call
-            mock_db_ops.get_by_id.assert_called_once_with(
-                table="municipalities",
-                id_value=1,
-                fields=["id", "name", "type", "state_id"]
-            )
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.get_by_id.return_value = mock_result
+        
+        result = await MunicipalityService.get_municipality_by_id(1)
+        
+        assert isinstance(result, Municipality)
+        assert result.name == "Los Angeles"
+        
+        # Verify DatabaseOperations call
+        mock_db_ops.get_by_id.assert_called_once_with(
+            table="municipalities",
+            id_value=1,
+            fields=["id", "name", "type", "state_id"]
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_municipality_by_id_not_found(self):
+    async def test_get_municipality_by_id_not_found(self, mocked_db):
         """Test retrieval of non-existent municipality by ID."""
-        with patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.get_by_id.return_value = None
-            
-            result = await MunicipalityService.get_municipality_by_id(999)
-            
-            assert result is None
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.get_by_id.return_value = None
+        
+        result = await MunicipalityService.get_municipality_by_id(999)
+        
+        assert result is None
 
-    @pytest.mark.asyncio
-    async def test_create_municipality_success(self, mock_state_data):
+    async def test_create_municipality_success(self, mock_state_data, mocked_db):
         """Test successful municipality creation."""
         municipality_data = MunicipalityCreate(name="Oakland", type="city", state_id=1)
         mock_result = {"id": 4, "name": "Oakland", "type": "city", "state_id": 1}
         mock_state = mock_state_data[0]
+        mock_db_ops = mocked_db.ops
         
-        with patch('lightspun.services.municipality_service.StateService') as mock_state_service, \
-             patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            
-            mock_state_service.get_state_by_id.return_value = MagicMock(**mock_state)
+        with patch('lightspun.services.municipality_service.StateService', new_callable=AsyncMock) as mock_state_service:
+            mock_state_service.get_state_by_id.return_value = SimpleNamespace(**mock_state)
             mock_db_ops.create.return_value = mock_result
             
             result = await MunicipalityService.create_municipality(municipality_data)
@@ -138,87 +142,126 @@ class TestMunicipalityService:
             assert isinstance(result, Municipality)
             assert result.name == "Oakland"
             
+            # A second create for the same state reuses the cached lookup
+            await MunicipalityService.create_municipality(municipality_data)
+            
             # Verify state validation
             mock_state_service.get_state_by_id.assert_called_once_with(1)
+            assert mock_db_ops.create.call_count == 2
             
             # Verify creation
-            mock_db_ops.create.assert_called_once_with(
+            mock_db_ops.create.assert_called_with(
                 table="municipalities",
                 data=municipality_data.model_dump(),
                 returning=["id", "name", "type", "state_id"]
             )
 
-    @pytest.mark.asyncio
     async def test_create_municipality_invalid_state(self):
         """Test municipality creation with invalid state."""
         municipality_data = MunicipalityCreate(name="Oakland", type="city", state_id=999)
         
-        with patch('lightspun.services.municipality_service.StateService') as mock_state_service:
+        with patch('lightspun.services.municipality_service.StateService', new_callable=AsyncMock) as mock_state_service:
             mock_state_service.get_state_by_id.return_value = None
             
             with pytest.raises(ValueError, match="State with ID 999 does not exist"):
                 await MunicipalityService.create_municipality(municipality_data)
 
-    @pytest.mark.asyncio
-    async def test_create_municipality_failure(self, mock_state_data):
+    async def test_create_municipality_failure(self, mock_state_data, mocked_db):
         """Test municipality creation failure."""
         municipality_data = MunicipalityCreate(name="Oakland", type="city", state_id=1)
         mock_state = mock_state_data[0]
+        mock_db_ops = mocked_db.ops
         
-        with patch('lightspun.services.municipality_service.StateService') as mock_state_service, \
-             patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            
-            mock_state_service.get_state_by_id.return_value = MagicMock(**mock_state)
+        with patch('lightspun.services.municipality_service.StateService', new_callable=AsyncMock) as mock_state_service:
+            mock_state_service.get_state_by_id.return_value = SimpleNamespace(**mock_state)
             mock_db_ops.create.return_value = None
             
             with pytest.raises(RuntimeError, match="Failed to create municipality"):
                 await MunicipalityService.create_municipality(municipality_data)
+            
+            # The state was valid, so it is cached even though the insert failed
+            with pytest.raises(RuntimeError, match="Failed to create municipality"):
+                await MunicipalityService.create_municipality(municipality_data)
+            mock_state_service.get_state_by_id.assert_called_once_with(1)
+
+    async def test_create_municipality_after_state_deleted(self, mock_state_data, mocked_db, monkeypatch):
+        """Deleting a state clears the cached lookups, so the next create queries it again."""
+        municipality_data = MunicipalityCreate(name="Oakland", type="city", state_id=1)
+        mock_state = mock_state_data[0]
+        mock_db_ops = mocked_db.ops
+        monkeypatch.setattr(_state_svc, "DatabaseOperations", mock_db_ops)
+        
+        with patch('lightspun.services.municipality_service.StateService', new_callable=AsyncMock) as mock_state_service:
+            mock_state_service.get_state_by_id.return_value = SimpleNamespace(**mock_state)
+            mock_db_ops.create.return_value = {"id": 4, "name": "Oakland", "type": "city", "state_id": 1}
+            
+            # Seed the cache
+            await MunicipalityService.create_municipality(municipality_data)
+            
+            # Delete the state through the real StateService
+            mock_db_ops.get_by_id.return_value = mock_state
+            mocked_db.db.fetch_val.return_value = 0
+            mock_db_ops.delete_by_id.return_value = True
+            assert await StateService.delete_state(1) is True
+            
+            await MunicipalityService.create_municipality(municipality_data)
+            
+            assert mock_state_service.get_state_by_id.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_update_municipality_success(self, mock_municipality_data):
+    async def test_create_municipality_after_state_cache_expired(self, mock_state_data, mocked_db, monkeypatch):
+        """Cached states expire, so changes made by other workers are eventually seen."""
+        municipality_data = MunicipalityCreate(name="Oakland", type="city", state_id=1)
+        monkeypatch.setattr(_svc, "STATE_CACHE_TTL", 0.0)
+        
+        with patch('lightspun.services.municipality_service.StateService', new_callable=AsyncMock) as mock_state_service:
+            mock_state_service.get_state_by_id.return_value = SimpleNamespace(**mock_state_data[0])
+            mocked_db.ops.create.return_value = {"id": 4, "name": "Oakland", "type": "city", "state_id": 1}
+            
+            await MunicipalityService.create_municipality(municipality_data)
+            await MunicipalityService.create_municipality(municipality_data)
+            
+            assert mock_state_service.get_state_by_id.call_count == 2
+
+    async def test_update_municipality_success(self, mock_municipality_data, mocked_db):
         """Test successful municipality update."""
         municipality_data = MunicipalityUpdate(name="New Los Angeles")
         mock_result = {"id": 1, "name": "New Los Angeles", "type": "city", "state_id": 1}
         
-        with patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.update_by_id.return_value = mock_result
-            
-            result = await MunicipalityService.update_municipality(1, municipality_data)
-            
-            assert isinstance(result, Municipality)
-            assert result.name == "New Los Angeles"
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.update_by_id.return_value = mock_result
+        
+        result = await MunicipalityService.update_municipality(1, municipality_data)
+        
+        assert isinstance(result, Municipality)
+        assert result.name == "New Los Angeles"
 
-    @pytest.mark.asyncio
-    async def test_update_municipality_no_changes(self):
+    async def test_update_municipality_no_changes(self, la_city):
         """Test municipality update with no changes."""
         municipality_data = MunicipalityUpdate()  # No fields set
-        mock_current_municipality = Municipality(id=1, name="Los Angeles", type="city", state_id=1)
+        mock_current_municipality = la_city
         
         with patch.object(MunicipalityService, 'get_municipality_by_id', return_value=mock_current_municipality):
             result = await MunicipalityService.update_municipality(1, municipality_data)
             
             assert result == mock_current_municipality
 
-    @pytest.mark.asyncio
-    async def test_update_municipality_not_found(self):
+    async def test_update_municipality_not_found(self, mocked_db):
         """Test updating non-existent municipality."""
         municipality_data = MunicipalityUpdate(name="New Name")
         
-        with patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            mock_db_ops.update_by_id.return_value = None
-            
-            result = await MunicipalityService.update_municipality(999, municipality_data)
-            
-            assert result is None
+        mock_db_ops = mocked_db.ops
+        mock_db_ops.update_by_id.return_value = None
+        
+        result = await MunicipalityService.update_municipality(999, municipality_data)
+        
+        assert result is None
 
-    @pytest.mark.asyncio
-    async def test_delete_municipality_success(self):
+    async def test_delete_municipality_success(self, mocked_db, la_city):
         """Test successful municipality deletion."""
-        mock_municipality = Municipality(id=1, name="Los Angeles", type="city", state_id=1)
+        mock_municipality = la_city
+        mock_db_ops = mocked_db.ops
         
-        with patch.object(MunicipalityService, 'get_municipality_by_id', return_value=mock_municipality), \
-             patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops:
-            
+        with patch.object(MunicipalityService, 'get_municipality_by_id', return_value=mock_municipality):
             mock_db_ops.delete_by_id.return_value = True
             
             result = await MunicipalityService.delete_municipality(1)
@@ -226,47 +269,38 @@ class TestMunicipalityService:
             assert result is True
             mock_db_ops.delete_by_id.assert_called_once_with("municipalities", 1)
 
-    @pytest.mark.asyncio
     async def test_delete_municipality_not_found(self):
         """Test deletion of non-existent municipality."""
         with patch.object(MunicipalityService, 'get_municipality_by_id', return_value=None):
             result = await MunicipalityService.delete_municipality(999)
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_get_municipalities_by_type(self, mock_municipality_data):
+    async def test_get_municipalities_by_type(self, mock_city_rows, mocked_db):
         """Test retrieval of municipalities by type."""
-        # Filter for cities only
-        city_data = [m for m in mock_municipality_data if m['type'] == 'city']
-        mock_rows = [MagicMock(**municipality) for municipality in city_data]
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_city_rows
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.get_municipalities_by_type("city", limit=50)
-            
-            assert len(result) == 3
-            assert all(municipality.type == "city" for municipality in result)
-            
-            # Verify query parameters
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert values['municipality_type'] == "city"
-            assert values['limit'] == 50
+        result = await MunicipalityService.get_municipalities_by_type("city", limit=50)
+        
+        assert len(result) == 3
+        assert all(municipality.type == "city" for municipality in result)
+        
+        # Verify query parameters
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['municipality_type'] == "city"
+        assert values['limit'] == 50
 
-    @pytest.mark.asyncio
-    async def test_get_municipalities_by_type_default_limit(self):
+    async def test_get_municipalities_by_type_default_limit(self, mocked_db):
         """Test retrieval of municipalities by type with default limit."""
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = []
-            
-            await MunicipalityService.get_municipalities_by_type("city")
-            
-            call_args = mock_db.fetch_all.call_args
-            assert call_args[1]['values']['limit'] == 50  # Default limit
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = []
+        
+        await MunicipalityService.get_municipalities_by_type("city")
+        
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert values['limit'] == 50  # Default limit
 
-    @pytest.mark.asyncio
-    async def test_get_municipality_statistics(self):
+    async def test_get_municipality_statistics(self, mocked_db):
         """Test retrieval of municipality statistics."""
         mock_total_count = 100
         mock_type_stats = [
@@ -278,94 +312,91 @@ class TestMunicipalityService:
             {"state_name": "Texas", "state_code": "TX", "municipality_count": 30}
         ]
         
-        with patch('lightspun.services.municipality_service.DatabaseOperations') as mock_db_ops, \
-             patch('lightspun.services.municipality_service.database') as mock_db:
-            
-            mock_db_ops.count.return_value = mock_total_count
-            mock_db.fetch_all.side_effect = [
-                [MagicMock(**stat) for stat in mock_type_stats],
-                [MagicMock(**stat) for stat in mock_state_stats]
-            ]
-            
-            result = await MunicipalityService.get_municipality_statistics()
-            
-            assert result['total_municipalities'] == 100
-            assert len(result['by_type']) == 2
-            assert result['by_type'][0]['type'] == 'city'
-            assert result['by_type'][0]['count'] == 80
-            assert len(result['top_states']) == 2
-            assert result['top_states'][0]['state_name'] == 'California'
+        mocked_db.ops.count.return_value = mock_total_count
+        
+        # The queries run concurrently, so answer by query rather than by
+        # call order
+        def _dispatch(query, values=None):
+            return mock_type_stats if "GROUP BY type" in str(query) else mock_state_stats
+        
+        mocked_db.db.fetch_all.side_effect = _dispatch
+        
+        result = await MunicipalityService.get_municipality_statistics()
+        
+        assert result['total_municipalities'] == 100
+        assert len(result['by_type']) == 2
+        assert result['by_type'][0]['type'] == 'city'
+        assert result['by_type'][0]['count'] == 80
+        assert len(result['top_states']) == 2
+        assert result['top_states'][0]['state_name'] == 'California'
+        
+        # All three queries were awaited
+        mocked_db.ops.count.assert_awaited_once_with("municipalities")
+        assert mocked_db.db.fetch_all.await_count == 2
 
-    @pytest.mark.asyncio
-    async def test_search_municipalities_advanced_all_filters(self):
+    async def test_search_municipalities_advanced_all_filters(self, mocked_db):
         """Test advanced municipality search with all filters."""
-        mock_rows = [MagicMock(id=1, name="Los Angeles", type="city", state_id=1)]
+        mock_rows = [{"id": 1, "name": "Los Angeles", "type": "city", "state_id": 1}]
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.search_municipalities_advanced(
-                name_query="angeles",
-                municipality_type="city", 
-                state_code="CA",
-                limit=10
-            )
-            
-            assert len(result) == 1
-            assert result[0].name == "Los Angeles"
-            
-            # Verify query parameters
-            call_args = mock_db.fetch_all.call_args
-            values = call_args[1]['values']
-            assert "angeles" in values['name_pattern']
-            assert values['municipality_type'] == "city"
-            assert values['state_code'] == "CA"
-            assert values['limit'] == 10
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_rows
+        
+        result = await MunicipalityService.search_municipalities_advanced(
+            name_query="angeles",
+            municipality_type="city", 
+            state_code="CA",
+            limit=10
+        )
+        
+        assert len(result) == 1
+        assert result[0].name == "Los Angeles"
+        
+        # Verify query parameters
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        assert "angeles" in values['name_pattern']
+        assert values['municipality_type'] == "city"
+        assert values['state_code'] == "CA"
+        assert values['limit'] == 10
 
-    @pytest.mark.asyncio
-    async def test_search_municipalities_advanced_partial_filters(self):
+    async def test_search_municipalities_advanced_partial_filters(self, mocked_db):
         """Test advanced municipality search with partial filters."""
         mock_rows = []
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.search_municipalities_advanced(
-                name_query="angeles",
-                municipality_type=None,
-                state_code=None,
-                limit=20
-            )
-            
-            assert result == []
-            
-            # Verify only name filter was applied
-            call_args = mock_db.fetch_all.call_args
-            query = call_args[1]['query']
-            values = call_args[1]['values']
-            
-            assert "name_pattern" in values
-            assert "municipality_type" not in values
-            assert "state_code" not in values
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_rows
+        
+        result = await MunicipalityService.search_municipalities_advanced(
+            name_query="angeles",
+            municipality_type=None,
+            state_code=None,
+            limit=20
+        )
+        
+        assert result == []
+        
+        # Verify only name filter was applied
+        values = mock_db.fetch_all.call_args.kwargs['values']
+        
+        assert "name_pattern" in values
+        assert "municipality_type" not in values
+        assert "state_code" not in values
 
-    @pytest.mark.asyncio
-    async def test_search_municipalities_advanced_no_filters(self):
+    async def test_search_municipalities_advanced_no_filters(self, mocked_db):
         """Test advanced municipality search with no filters."""
-        mock_rows = [MagicMock(id=i, name=f"City {i}", type="city", state_id=1) for i in range(5)]
+        mock_rows = [{"id": i, "name": f"City {i}", "type": "city", "state_id": 1} for i in range(5)]
         
-        with patch('lightspun.services.municipality_service.database') as mock_db:
-            mock_db.fetch_all.return_value = mock_rows
-            
-            result = await MunicipalityService.search_municipalities_advanced(
-                name_query=None,
-                municipality_type=None,
-                state_code=None,
-                limit=20
-            )
-            
-            assert len(result) == 5
-            
-            # Verify no WHERE conditions were added
-            call_args = mock_db.fetch_all.call_args
-            query = call_args[1]['query']
-            assert "WHERE" not in query
\ No newline at end of file
+        mock_db = mocked_db.db
+        mock_db.fetch_all.return_value = mock_rows
+        
+        result = await MunicipalityService.search_municipalities_advanced(
+            name_query=None,
+            municipality_type=None,
+            state_code=None,
+            limit=20
+        )
+        
+        assert len(result) == 5
+        
+        # Verify no WHERE conditions were added
+        query = mock_db.fetch_all.call_args.kwargs['query']
+        assert "WHERE" not in query
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Tests for the street address parser used by update_street_components.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# update_street_components.py lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from update_street_components import parse_street_address
+
+PARSE_CASES = (
+    # street_address -> (street_number, street_name, unit)
+    ("123 Main Street", ("123", "Main Street", None)),
+    ("456A Oak Ave", ("456A", "Oak Ave", None)),
+    ("123 Main St Apt 2B", ("123", "Main St", "Apt 2B")),
+    ("789 First Street Suite 100", ("789", "First Street", "Suite 100")),
+    ("100 Main St Ste. 4", ("100", "Main St", "Ste 4")),
+    ("1000 Broadway #205", ("1000", "Broadway", "# 205")),
+
+    # Keywords are matched in any case and title-cased in the unit
+    ("123 Main St APARTMENT 4", ("123", "Main St", "Apartment 4")),
+    ("123 Main St bldg C", ("123", "Main St", "Bldg C")),
+    ("123 Main St apt2b", ("123", "Main St", "Apt 2b")),
+
+    # A keyword running into more letters is part of the street name
+    ("12 Stewart Ave", ("12", "Stewart Ave", None)),
+    ("12 Units Rd", ("12", "Units Rd", None)),
+
+    # A keyword with no designator after it is not a unit
+    ("Main Apt", (None, "Main Apt", None)),
+    ("123 Main St Apt .", ("123", "Main St Apt .", None)),
+    ("123 Main St Apt   ", ("123", "Main St Apt", None)),
+
+    # Leading whitespace
+    ("  123 Main St", ("123", "Main St", None)),
+    ("  Apt 5", (None, "", "Apt 5")),
+
+    # Any Unicode decimal digits form a street number
+    ("١٢٣ Main St", ("١٢٣", "Main St", None)),
+
+    # Edge cases
+    ("Main Street", (None, "Main Street", None)),  # No number
+    ("456AB Oak Ave", (None, "456AB Oak Ave", None)),  # More than one letter
+    ("123", (None, "123", None)),  # Just number
+    ("", (None, "", None)),  # Empty string
+)
+
+@pytest.mark.parametrize("street_address,expected", PARSE_CASES)
+def test_parse_street_address(street_address, expected):
+    """Test splitting a street address into number, name and unit"""
+    assert parse_street_address(street_address) == expected
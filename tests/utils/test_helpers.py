@@ -3,24 +3,91 @@ Test utilities and helper functions.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
-from unittest.mock import MagicMock
+import atexit
+import time
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+from unittest.mock import AsyncMock
 import pytest
 
 
+@lru_cache(maxsize=None)
+def _row_type(fields: Tuple[str, ...]) -> type:
+    """Build (once per field set) a lightweight row class.
+    
+    Rows support attribute access, ``row["name"]`` and ``dict(row)`` like the
+    records returned by ``databases``.
+    """
+    class Row(namedtuple("Row", fields)):
+        __slots__ = ()
+        
+        def keys(self):
+            return self._fields
+        
+        def __getitem__(self, key):
+            if isinstance(key, str):
+                return getattr(self, key)
+            return super().__getitem__(key)
+    
+    return Row
+
+
+# Canned records used by MockDataBuilder. Builders hand out fresh copies so
+# tests can mutate what they get back.
+_STATES_TEMPLATE: Tuple[Dict[str, Any], ...] = (
+    {"id": 1, "code": "CA", "name": "California"},
+    {"id": 2, "code": "NY", "name": "New York"},
+    {"id": 3, "code": "TX", "name": "Texas"},
+    {"id": 4, "code": "FL", "name": "Florida"},
+    {"id": 5, "code": "WA", "name": "Washington"},
+)
+
+_MUNICIPALITIES_TEMPLATE: Tuple[Dict[str, Any], ...] = (
+    {"id": 1, "name": "Los Angeles", "type": "city"},
+    {"id": 2, "name": "San Francisco", "type": "city"},
+    {"id": 3, "name": "Sacramento", "type": "city"},
+    {"id": 4, "name": "Oakland", "type": "city"},
+    {"id": 5, "name": "San Diego", "type": "city"},
+)
+
+_ADDRESSES_TEMPLATE: Tuple[Dict[str, Any], ...] = (
+    {"id": 1, "street_address": "123 Main Street"},
+    {"id": 2, "street_address": "456 Oak Avenue"},
+    {"id": 3, "street_address": "789 Pine Road"},
+    {"id": 4, "street_address": "321 Elm Street"},
+    {"id": 5, "street_address": "654 Maple Drive"},
+)
+
+
+# Event loop reused by AsyncTestHelper.run_async_test, created on first use
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _helper_loop() -> asyncio.AbstractEventLoop:
+    """Return the helper event loop, creating it once per process."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
+
+@atexit.register
+def _close_helper_loop() -> None:
+    if _LOOP is not None and not _LOOP.is_closed():
+        _LOOP.close()
+
+
 class DatabaseTestHelper:
     """Helper class for database-related test operations."""
     
     @staticmethod
-    def create_mock_row(data: Dict[str, Any]) -> MagicMock:
+    def create_mock_row(data: Dict[str, Any]) -> tuple:
         """Create a mock database row object."""
-        mock_row = MagicMock()
-        for key, value in data.items():
-            setattr(mock_row, key, value)
-        return mock_row
+        return _row_type(tuple(data))(**data)
     
     @staticmethod
-    def create_mock_rows(data_list: List[Dict[str, Any]]) -> List[MagicMock]:
+    def create_mock_rows(data_list: List[Dict[str, Any]]) -> List[tuple]:
         """Create a list of mock database row objects."""
         return [DatabaseTestHelper.create_mock_row(data) for data in data_list]
     
@@ -28,11 +95,10 @@ class DatabaseTestHelper:
     def assert_database_call(mock_db, method_name: str, expected_query_contains: str = None):
         """Assert that a database method was called with expected parameters."""
         method = getattr(mock_db, method_name)
-        assert method.called, f"Expected {method_name} to be called"
+        method.assert_called()
         
         if expected_query_contains:
-            call_args = method.call_args
-            query = call_args[1].get('query', '')
+            query = method.call_args.kwargs.get('query', '')
             assert expected_query_contains in query, f"Expected query to contain '{expected_query_contains}'"
 
 
@@ -109,38 +175,23 @@ class MockDataBuilder:
     @staticmethod
     def build_multiple_states(count: int = 3) -> List[Dict[str, Any]]:
         """Build multiple states for testing."""
-        states_data = [
-            {"id": 1, "code": "CA", "name": "California"},
-            {"id": 2, "code": "NY", "name": "New York"},
-            {"id": 3, "code": "TX", "name": "Texas"},
-            {"id": 4, "code": "FL", "name": "Florida"},
-            {"id": 5, "code": "WA", "name": "Washington"}
-        ]
-        return states_data[:count]
+        return [dict(state) for state in _STATES_TEMPLATE[:count]]
     
     @staticmethod
     def build_multiple_municipalities(state_id: int = 1, count: int = 3) -> List[Dict[str, Any]]:
         """Build multiple municipalities for testing."""
-        municipalities_data = [
-            {"id": 1, "name": "Los Angeles", "type": "city", "state_id": state_id},
-            {"id": 2, "name": "San Francisco", "type": "city", "state_id": state_id},
-            {"id": 3, "name": "Sacramento", "type": "city", "state_id": state_id},
-            {"id": 4, "name": "Oakland", "type": "city", "state_id": state_id},
-            {"id": 5, "name": "San Diego", "type": "city", "state_id": state_id}
+        return [
+            {**municipality, "state_id": state_id}
+            for municipality in _MUNICIPALITIES_TEMPLATE[:count]
         ]
-        return municipalities_data[:count]
     
     @staticmethod
     def build_multiple_addresses(municipality_id: int = 1, count: int = 5) -> List[Dict[str, Any]]:
         """Build multiple addresses for testing."""
-        addresses_data = [
-            {"id": 1, "street_address": "123 Main Street", "municipality_id": municipality_id},
-            {"id": 2, "street_address": "456 Oak Avenue", "municipality_id": municipality_id},
-            {"id": 3, "street_address": "789 Pine Road", "municipality_id": municipality_id},
-            {"id": 4, "street_address": "321 Elm Street", "municipality_id": municipality_id},
-            {"id": 5, "street_address": "654 Maple Drive", "municipality_id": municipality_id}
+        return [
+            {**address, "municipality_id": municipality_id}
+            for address in _ADDRESSES_TEMPLATE[:count]
         ]
-        return addresses_data[:count]
 
 
 class AsyncTestHelper:
@@ -149,15 +200,12 @@ class AsyncTestHelper:
     @staticmethod
     def create_async_mock(return_value=None):
         """Create an async mock function."""
-        async def async_mock(*args, **kwargs):
-            return return_value
-        return AsyncMock(side_effect=async_mock)
+        return AsyncMock(return_value=return_value)
     
     @staticmethod
     def run_async_test(async_func, *args, **kwargs):
         """Run an async function in a test environment."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(async_func(*args, **kwargs))
+        return _helper_loop().run_until_complete(async_func(*args, **kwargs))
 
 
 class ValidationTestHelper:
@@ -193,20 +241,18 @@ class PerformanceTestHelper:
     
     @staticmethod
     def measure_execution_time(func, *args, **kwargs):
-        """Measure execution time of a function."""
-        import time
-        start_time = time.time()
+        """Measure execution time of a function in seconds."""
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         return result, duration
     
     @staticmethod
     async def measure_async_execution_time(async_func, *args, **kwargs):
-        """Measure execution time of an async function."""
-        import time
-        start_time = time.time()
+        """Measure execution time of an async function in seconds."""
+        start_ns = time.perf_counter_ns()
         result = await async_func(*args, **kwargs)
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         return result, duration
     
     @staticmethod